@@ -40,10 +40,48 @@ COLORS = {
     'text_light': '#ffffff',
     'text_muted': 'rgba(255,255,255,0.7)'
 }
+import functools
+from typing import NamedTuple
+
 import pandas as pd
 import numpy as np
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
+# Plotly and Numba are imported on first use so the landing page renders without them
+
+@st.cache_resource(show_spinner=False)
+def _jit_dispatcher(name, code_hash, _func, options):
+    """
+    Compile _func with numba.njit once per server process.
+    
+    Streamlit re-executes this script on every rerun, redefining each kernel; keying on
+    the function's name and bytecode lets every rerun share the first compiled dispatcher.
+    Numba is optional; without it the plain NumPy function is returned.
+    """
+    try:
+        from numba import njit as numba_njit
+    except ImportError:
+        return _func
+    return numba_njit(**dict(options))(_func)
+
+def _lazy_njit(**options):
+    """
+    Decorator that JIT-compiles a kernel with numba.njit(**options) on its first call.
+    
+    The compiled dispatcher is looked up once per decorated function and then called
+    directly, so later calls cost no more than calling Numba itself.
+    """
+    def decorate(func):
+        dispatcher = None
+        
+        @functools.wraps(func)
+        def wrapper(*args):
+            nonlocal dispatcher
+            if dispatcher is None:
+                dispatcher = _jit_dispatcher(
+                    func.__qualname__, hash(func.__code__), func, tuple(sorted(options.items()))
+                )
+            return dispatcher(*args)
+        return wrapper
+    return decorate
 
 # =============================================================================
 # SESSION STATE INITIALIZATION
@@ -52,7 +90,7 @@ from plotly.subplots import make_subplots
 if 'current_page' not in st.session_state:
     st.session_state.current_page = 'landing'
 if 'esg_data' not in st.session_state:
-    st.session_state.esg_data = {}
+    st.session_state.esg_data = None
 if 'show_dcf' not in st.session_state:
     st.session_state.show_dcf = False
 
@@ -60,336 +98,519 @@ if 'show_dcf' not in st.session_state:
 # STYLING AND CSS
 # =============================================================================
 
+# Base styles shared by every page
+_CUSTOM_CSS = """
+<style>
+    /* Main page background */
+    .main {
+        background-color: #f0f7f4;
+    }
+    
+    /* Page container styling */
+    .page-container {
+        background: linear-gradient(120deg, #f7ffe0 0%, #e6f4d7 100%);
+        padding: 3rem 2rem 2.5rem 2rem;
+        border-radius: 18px;
+        color: #2d3a1a;
+        margin: 2rem auto;
+        max-width: 700px;
+        box-shadow: 0 8px 32px 0 rgba(60, 80, 60, 0.10), 0 1.5px 6px 0 rgba(60, 80, 60, 0.08);
+        font-family: 'Segoe UI', 'Roboto', Arial, sans-serif;
+    }
+    
+    /* Typography */
+    .page-title {
+        font-size: 2.5rem;
+        font-weight: 700;
+        margin-bottom: 0.7rem;
+        color: #3b5e2b;
+        letter-spacing: 0.5px;
+        text-align: center;
+    }
+    
+    .page-subtitle {
+        font-size: 1.18rem;
+        margin-bottom: 2.2rem;
+        color: #7a8f3e;
+        text-align: center;
+        line-height: 1.6;
+        font-weight: 400;
+    }
+    
+    .section-title {
+        color: #4e6e2a;
+        font-size: 1.35rem;
+        margin-top: 1.7rem;
+        margin-bottom: 0.7rem;
+        font-weight: 600;
+        letter-spacing: 0.2px;
+    }
+    
+    /* Professional Button styling */
+    .stButton>button {
+        background: linear-gradient(135deg, #2E86AB 0%, #0B132B 100%);
+        color: white;
+        font-size: 1.1rem;
+        font-weight: 600;
+        padding: 1rem 2rem;
+        border-radius: 8px;
+        border: none;
+        box-shadow: 0 4px 12px rgba(46, 134, 171, 0.3);
+        transition: all 0.3s ease;
+        width: 100%;
+        max-width: 300px;
+        margin: 2rem auto;
+        display: block;
+        text-transform: uppercase;
+        letter-spacing: 0.5px;
+    }
+    
+    .stButton>button:hover {
+        transform: translateY(-2px);
+        box-shadow: 0 6px 16px rgba(46, 134, 171, 0.4);
+        background: linear-gradient(135deg, #3B9BC8 0%, #1A1F3A 100%);
+    }
+</style>
+"""
+
+# Dark theme styles for the ESG inputs page
+_ESG_INPUT_CSS = """
+<style>
+    /* Set dark background for the app */
+    .stApp {
+        background: linear-gradient(120deg, #14171c 0%, #22272e 100%) !important;
+        min-height: 100vh;
+    }
+    /* Set main page container to 75vw width for better screen utilization */
+    .stApp .main .block-container,
+    .main .block-container,
+    div.block-container {
+        background: none !important;
+        box-shadow: none !important;
+        border: none !important;
+        padding: 2rem 0 !important;
+        margin-left: auto !important;
+        margin-right: auto !important;
+        width: 75vw !important;
+        min-width: 800px !important;
+        max-width: 2800px !important;
+    }
+    
+    /* Additional override for Streamlit's container */
+    .block-container.st-emotion-cache-1y4p8pa {
+        width: 75vw !important;
+        max-width: 2800px !important;
+    }
+    
+    /* Force width on all potential container classes */
+    [data-testid="block-container"] {
+        width: 75vw !important;
+        max-width: 2800px !important;
+        margin: 0 auto !important;
+    }
+    
+    /* Override any Streamlit default container styling */
+    .main > div:first-child {
+        width: 75vw !important;
+        max-width: 2800px !important;
+        margin: 0 auto !important;
+    }
+    /* Form block styling - now fits within main container */
+    .stForm {
+        width: 100% !important;
+        margin-left: auto;
+        margin-right: auto;
+        background: linear-gradient(120deg, rgba(10,12,18,0.92) 0%, rgba(22,24,32,0.88) 100%);
+        border-radius: 20px;
+        padding: 2.7rem 2.7rem 2.1rem 2.7rem !important;
+        box-shadow: 0 2px 24px 0 rgba(0,0,0,0.17), 0 0 0 1.2px rgba(255,255,255,0.08) inset;
+        border: 1.7px solid rgba(0,0,0,0.85);
+        backdrop-filter: blur(24px) saturate(160%);
+        -webkit-backdrop-filter: blur(24px) saturate(160%);
+        transition: box-shadow 0.3s;
+    }
+    /* Add elegant side padding to sliders */
+    .stSlider, .stSlider > div {
+        padding-left: 1.3rem !important;
+        padding-right: 1.3rem !important;
+    }
+    .stSlider .css-1yycg8u, .stSlider .st-cw {
+        padding-left: 0.6rem !important;
+        padding-right: 0.6rem !important;
+    }
+    /* Professional slider styling */
+    .stSlider .rc-slider-handle {
+        background: rgba(255,255,255,0.9) !important;
+        border: 2.2px solid #2E86AB !important;
+        box-shadow: 0 2px 8px 0 rgba(46, 134, 171, 0.3);
+    }
+    .stSlider .rc-slider-track {
+        background: linear-gradient(90deg, #2E86AB 0%, #A23B72 100%) !important;
+        height: 6px !important;
+        border-radius: 3px !important;
+    }
+    .stSlider .rc-slider-rail {
+        background: rgba(139, 157, 195, 0.2) !important;
+        height: 6px !important;
+        border-radius: 3px !important;
+    }
+
+    .esg-title {
+        font-size: 2.8rem;
+        font-weight: 800;
+        text-align: center;
+        margin-top: 5vh;
+        margin-bottom: 0.5rem;
+        font-family: 'Segoe UI', Arial, sans-serif;
+        color: #fff;
+        letter-spacing: 0.5px;
+        line-height: 1.1;
+    }
+    .esg-sub {
+        color: #fff;
+        text-align: center;
+        margin-bottom: 2.5rem;
+        font-size: 1.25rem;
+        font-family: 'Segoe UI', Arial, sans-serif;
+        font-weight: 400;
+        opacity: 0.95;
+    }
+    .esg-col-title {
+        text-align: left;
+        font-weight: 700;
+        color: #333;
+        margin-bottom: 1.2rem;
+        margin-top: 2.2rem;
+        font-size: 2rem;
+        font-family: 'Segoe UI', Arial, sans-serif;
+        letter-spacing: 0.5px;
+    }
+</style>
+"""
+
+# Static HTML blocks are built once at import; per-run values are filled in with str.format.
+# Section banners carry the first subheading of their section so both go out in one element.
+_ESG_DASHBOARD_HEADER_HTML = """
+<div style="background: linear-gradient(135deg, rgba(46, 134, 171, 0.15) 0%, rgba(162, 59, 114, 0.1) 100%);
+            border-radius: 15px; padding: 2rem; margin: 2rem 0;
+            border: 1px solid rgba(46, 134, 171, 0.3);">
+    <h2 style="color: {primary}; text-align: center; margin-bottom: 1rem; font-size: 2rem;">
+        🌱 ESG IMPACT DASHBOARD
+    </h2>
+    <p style="color: white; text-align: center; font-size: 1.1rem; opacity: 0.9;">
+        Visualizing the financial impact of sustainability initiatives
+    </p>
+</div>
+
+### 📊 ESG-Driven Margin Improvements
+""".format(primary=COLORS['primary'])
+
+# Colours are fixed here; {uplift} and {pct} are left for display_dcf_results
+_VALUE_CREATION_CARD_TEMPLATE = """
+<div style="background: linear-gradient(135deg, rgba(46, 134, 171, 0.1) 0%, rgba(162, 59, 114, 0.08) 100%);
+            border-radius: 8px; padding: 0.8rem; margin: 0.5rem 0;
+            border: 1px solid rgba(46, 134, 171, 0.2); text-align: center;">
+    <h4 style="color: {primary}; margin: 0 0 0.5rem 0; font-size: 1.1rem;">💡 ESG Value Creation Impact</h4>
+    <div style="display: flex; justify-content: space-around;">
+        <div>
+            <span style="color: white; font-size: 0.9rem;">Total Uplift:</span>
+            <h3 style="color: {success}; margin: 0.2rem 0; font-size: 1.4rem;">${{uplift:,.0f}}M</h3>
+        </div>
+        <div>
+            <span style="color: white; font-size: 0.9rem;">Increase:</span>
+            <h3 style="color: {success}; margin: 0.2rem 0; font-size: 1.4rem;">{{pct:.1f}}%</h3>
+        </div>
+    </div>
+</div>
+""".format(primary=COLORS['primary'], success=COLORS['success'])
+
+_FINANCIAL_ANALYSIS_HEADER_HTML = """
+<div style="background: linear-gradient(135deg, rgba(255, 255, 255, 0.05) 0%, rgba(255, 255, 255, 0.02) 100%);
+            border-radius: 15px; padding: 2rem; margin: 2rem 0;
+            border: 1px solid rgba(255, 255, 255, 0.1);">
+    <h2 style="color: {text_light}; text-align: center; margin-bottom: 1rem; font-size: 2rem;">
+        📊 Detailed Financial Analysis
+    </h2>
+</div>
+
+### 📊 Projected Free Cash Flows
+""".format(text_light=COLORS['text_light'])
+
+_FEATURE_CARD_TEMPLATE = """
+<div style="
+    background: rgba(255, 255, 255, 0.1);
+    backdrop-filter: blur(10px);
+    border: 1px solid rgba(255, 255, 255, 0.2);
+    border-radius: 16px;
+    padding: 1.2rem 1rem;
+    text-align: center;
+    margin: 1rem 0;
+">
+    <h3 style="
+        font-size: 1.1rem;
+        font-weight: 600;
+        color: #ffffff;
+        margin-bottom: 0.6rem;
+        text-shadow: 0 1px 4px rgba(0,0,0,0.5);
+    ">{title}</h3>
+    <p style="
+        font-size: 0.85rem;
+        color: #ffffff;
+        opacity: 0.9;
+        line-height: 1.4;
+        text-shadow: 0 1px 3px rgba(0,0,0,0.4);
+    ">{body}</p>
+</div>
+"""
+
+_FEATURE_CARDS = (
+    ("ESG Integration",
+     "Seamlessly incorporate Environmental, Social, and Governance metrics into traditional financial models"),
+    ("Advanced Analytics",
+     "Research-backed coefficients and sophisticated algorithms for accurate ESG-adjusted valuations"),
+    ("Real-Time Results",
+     "Interactive dashboards with instant calculations and beautiful visualizations of your projections"),
+)
+
+_CTA_BUTTON_CSS = """
+<style>
+div[data-testid="column"] > div > div > div > div > div > button {
+    background: linear-gradient(135deg, #2E86AB 0%, #0B132B 100%) !important;
+    color: white !important;
+    font-size: 1.2rem !important;
+    font-weight: 700 !important;
+    padding: 1rem 2.5rem !important;
+    border: none !important;
+    border-radius: 8px !important;
+    box-shadow: 0 8px 25px rgba(46, 134, 171, 0.4), 0 4px 12px rgba(0, 0, 0, 0.3) !important;
+    transition: all 0.4s ease !important;
+    text-transform: uppercase !important;
+    letter-spacing: 1px !important;
+    width: 100% !important;
+    min-width: 250px !important;
+}
+
+div[data-testid="column"] > div > div > div > div > div > button:hover {
+    transform: translateY(-3px) scale(1.05) !important;
+    box-shadow: 0 12px 35px rgba(46, 134, 171, 0.6), 0 6px 20px rgba(0, 0, 0, 0.4) !important;
+    background: linear-gradient(135deg, #3B9BC8 0%, #1A1F3A 100%) !important;
+}
+</style>
+"""
+
 def load_custom_css():
     """Load custom CSS for consistent styling across all pages"""
-    st.markdown("""
-    <style>
-        /* Main page background */
-        .main {
-            background-color: #f0f7f4;
-        }
-        
-        /* Page container styling */
-        .page-container {
-            background: linear-gradient(120deg, #f7ffe0 0%, #e6f4d7 100%);
-            padding: 3rem 2rem 2.5rem 2rem;
-            border-radius: 18px;
-            color: #2d3a1a;
-            margin: 2rem auto;
-            max-width: 700px;
-            box-shadow: 0 8px 32px 0 rgba(60, 80, 60, 0.10), 0 1.5px 6px 0 rgba(60, 80, 60, 0.08);
-            font-family: 'Segoe UI', 'Roboto', Arial, sans-serif;
-        }
-        
-        /* Typography */
-        .page-title {
-            font-size: 2.5rem;
-            font-weight: 700;
-            margin-bottom: 0.7rem;
-            color: #3b5e2b;
-            letter-spacing: 0.5px;
-            text-align: center;
-        }
-        
-        .page-subtitle {
-            font-size: 1.18rem;
-            margin-bottom: 2.2rem;
-            color: #7a8f3e;
-            text-align: center;
-            line-height: 1.6;
-            font-weight: 400;
-        }
-        
-        .section-title {
-            color: #4e6e2a;
-            font-size: 1.35rem;
-            margin-top: 1.7rem;
-            margin-bottom: 0.7rem;
-            font-weight: 600;
-            letter-spacing: 0.2px;
-        }
-        
-        /* Professional Button styling */
-        .stButton>button {
-            background: linear-gradient(135deg, #2E86AB 0%, #0B132B 100%);
-            color: white;
-            font-size: 1.1rem;
-            font-weight: 600;
-            padding: 1rem 2rem;
-            border-radius: 8px;
-            border: none;
-            box-shadow: 0 4px 12px rgba(46, 134, 171, 0.3);
-            transition: all 0.3s ease;
-            width: 100%;
-            max-width: 300px;
-            margin: 2rem auto;
-            display: block;
-            text-transform: uppercase;
-            letter-spacing: 0.5px;
-        }
-        
-        .stButton>button:hover {
-            transform: translateY(-2px);
-            box-shadow: 0 6px 16px rgba(46, 134, 171, 0.4);
-            background: linear-gradient(135deg, #3B9BC8 0%, #1A1F3A 100%);
-        }
-    </style>
-    """, unsafe_allow_html=True)
+    st.markdown(_CUSTOM_CSS, unsafe_allow_html=True)
 
 def load_esg_input_css():
     """Load specific CSS for the ESG inputs page with dark theme"""
-    st.markdown("""
-    <style>
-        /* Set dark background for the app */
-        .stApp {
-            background: linear-gradient(120deg, #14171c 0%, #22272e 100%) !important;
-            min-height: 100vh;
-        }
-        /* Set main page container to 75vw width for better screen utilization */
-        .stApp .main .block-container,
-        .main .block-container,
-        div.block-container {
-            background: none !important;
-            box-shadow: none !important;
-            border: none !important;
-            padding: 2rem 0 !important;
-            margin-left: auto !important;
-            margin-right: auto !important;
-            width: 75vw !important;
-            min-width: 800px !important;
-            max-width: 2800px !important;
-        }
-        
-        /* Additional override for Streamlit's container */
-        .block-container.st-emotion-cache-1y4p8pa {
-            width: 75vw !important;
-            max-width: 2800px !important;
-        }
-        
-        /* Force width on all potential container classes */
-        [data-testid="block-container"] {
-            width: 75vw !important;
-            max-width: 2800px !important;
-            margin: 0 auto !important;
-        }
-        
-        /* Override any Streamlit default container styling */
-        .main > div:first-child {
-            width: 75vw !important;
-            max-width: 2800px !important;
-            margin: 0 auto !important;
-        }
-        /* Form block styling - now fits within main container */
-        .stForm {
-            width: 100% !important;
-            margin-left: auto;
-            margin-right: auto;
-            background: linear-gradient(120deg, rgba(10,12,18,0.92) 0%, rgba(22,24,32,0.88) 100%);
-            border-radius: 20px;
-            padding: 2.7rem 2.7rem 2.1rem 2.7rem !important;
-            box-shadow: 0 2px 24px 0 rgba(0,0,0,0.17), 0 0 0 1.2px rgba(255,255,255,0.08) inset;
-            border: 1.7px solid rgba(0,0,0,0.85);
-            backdrop-filter: blur(24px) saturate(160%);
-            -webkit-backdrop-filter: blur(24px) saturate(160%);
-            transition: box-shadow 0.3s;
-        }
-        /* Add elegant side padding to sliders */
-        .stSlider, .stSlider > div {
-            padding-left: 1.3rem !important;
-            padding-right: 1.3rem !important;
-        }
-        .stSlider .css-1yycg8u, .stSlider .st-cw {
-            padding-left: 0.6rem !important;
-            padding-right: 0.6rem !important;
-        }
-        /* Professional slider styling */
-        .stSlider .rc-slider-handle {
-            background: rgba(255,255,255,0.9) !important;
-            border: 2.2px solid #2E86AB !important;
-            box-shadow: 0 2px 8px 0 rgba(46, 134, 171, 0.3);
-        }
-        .stSlider .rc-slider-track {
-            background: linear-gradient(90deg, #2E86AB 0%, #A23B72 100%) !important;
-            height: 6px !important;
-            border-radius: 3px !important;
-        }
-        .stSlider .rc-slider-rail {
-            background: rgba(139, 157, 195, 0.2) !important;
-            height: 6px !important;
-            border-radius: 3px !important;
-        }
-
-        .esg-title {
-            font-size: 2.8rem;
-            font-weight: 800;
-            text-align: center;
-            margin-top: 5vh;
-            margin-bottom: 0.5rem;
-            font-family: 'Segoe UI', Arial, sans-serif;
-            color: #fff;
-            letter-spacing: 0.5px;
-            line-height: 1.1;
-        }
-        .esg-sub {
-            color: #fff;
-            text-align: center;
-            margin-bottom: 2.5rem;
-            font-size: 1.25rem;
-            font-family: 'Segoe UI', Arial, sans-serif;
-            font-weight: 400;
-            opacity: 0.95;
-        }
-        .esg-col-title {
-            text-align: left;
-            font-weight: 700;
-            color: #333;
-            margin-bottom: 1.2rem;
-            margin-top: 2.2rem;
-            font-size: 2rem;
-            font-family: 'Segoe UI', Arial, sans-serif;
-            letter-spacing: 0.5px;
-        }
-    </style>
-    """, unsafe_allow_html=True)
+    st.markdown(_ESG_INPUT_CSS, unsafe_allow_html=True)
 
 # =============================================================================
 # DCF CALCULATION FUNCTIONS
 # =============================================================================
 
+class DCFInputs(NamedTuple):
+    """Financial input parameters (percentages in form units; nwc_pct as a fraction)"""
+    revenue: float
+    cogs_inputs: tuple
+    sga: float
+    rd: float
+    opex: float
+    dep_pct: float
+    capex_pct: float
+    nwc_pct: float
+    growth_rate: float
+    wacc: float
+    tax_rate: float
+    net_debt: float
+    shares_outstanding: float
+
+class ESGData(NamedTuple):
+    """Current (Year 0) and target (Year 5) ESG metrics"""
+    ghg_0: float
+    water_0: float
+    diversity_0: float
+    swr_0: float
+    ghg_target: float
+    water_target: float
+    diversity_target: float
+    swr_target: float
+
+# Research-based ESG coefficients from empirical analysis, ordered as _ESG_METRICS
+_ESG_METRICS = ('ghg', 'water', 'diversity', 'swr')
+_ESG_COEFS = np.array([
+    -6.15,  # %GPM per MtCO2e reduction
+    -3.09,  # %GPM per m³ reduction
+    1.43,   # %EBIT per % female employee increase
+    -0.11   # %EBIT per % sustainable waste ratio increase
+])
+
+def _esg_deltas(esg_data):
+    """Target minus current value for each ESG metric, ordered as _ESG_METRICS"""
+    return np.array([getattr(esg_data, f'{k}_target') - getattr(esg_data, f'{k}_0') for k in _ESG_METRICS])
+
 def calculate_esg_adjustments(esg_data):
     """
     Calculate ESG-based adjustments to financial margins using research coefficients.
     
     Args:
-        esg_data (dict): Dictionary containing current and target ESG metrics
+        esg_data (ESGData): Current and target ESG metrics
         
     Returns:
         tuple: (gpm_shift, ebit_shift) - Gross Profit Margin and EBIT adjustments
     """
-    # Research-based ESG coefficients from empirical analysis
-    ghg_coef = -6.15        # %GPM per MtCO2e reduction
-    water_coef = -3.09      # %GPM per m³ reduction  
-    diversity_coef = 1.43   # %EBIT per % female employee increase
-    swr_coef = -0.11        # %EBIT per % sustainable waste ratio increase
-    
     # Calculate deltas between targets and current values
-    delta_ghg = esg_data['ghg_target'] - esg_data['ghg_0']
-    delta_water = esg_data['water_target'] - esg_data['water_0']
-    delta_div = esg_data['diversity_target'] - esg_data['diversity_0']
-    delta_swr = esg_data['swr_target'] - esg_data['swr_0']
+    deltas = _esg_deltas(esg_data)
     
-    # Calculate margin shifts based on ESG improvements
-    gpm_shift = ghg_coef * delta_ghg + water_coef * delta_water
-    ebit_shift = diversity_coef * delta_div + swr_coef * delta_swr
+    # Calculate margin shifts based on ESG improvements (GHG/water -> GPM, diversity/SWR -> EBIT)
+    contributions = _ESG_COEFS * deltas
+    gpm_shift = float(contributions[:2].sum())
+    ebit_shift = float(contributions[2:].sum())
     
     return gpm_shift, ebit_shift
 
-def calculate_dcf_projection(inputs, esg_adjustments):
+# Length of the explicit DCF projection period (years)
+_PROJECTION_YEARS = 5
+
+# Default per-year COGS ($M) seeding the input editor: one row, one column per projection year
+_COGS_DEFAULTS = pd.DataFrame(
+    [5000.0 + 100.0 * np.arange(_PROJECTION_YEARS)],
+    columns=[f"Year {i + 1}" for i in range(_PROJECTION_YEARS)],
+)
+
+@_lazy_njit(cache=True, fastmath=True)
+def _dcf_kernel(revenue_0, growth_rate, wacc, tax_rate, nwc_pct, dep_pct, capex_pct,
+                sga, rd, opex, base_gross_margin, gpm_shifts, ebit_shifts):
     """
-    Calculate the 5-year DCF projection with ESG adjustments.
+    Numeric core of the 5-year DCF projection (no pandas, float64 arrays only).
+    
+    Projects several ESG scenarios at once: gpm_shifts and ebit_shifts are 1-D arrays
+    with one entry per scenario. Percentage arguments use the same units as the
+    financial inputs form.
     
-    Args:
-        inputs (dict): Financial input parameters
-        esg_adjustments (tuple): ESG-based margin adjustments
-        
     Returns:
-        pandas.DataFrame: DCF projection with all cash flow components
+        tuple: (revenue, cogs, ebit, ebiat, depreciation, capex, delta_nwc,
+                fcf, discount_factor, discounted_fcf) arrays. Lines that do not depend
+                on the margins (revenue, depreciation, capex, delta_nwc, discount_factor)
+                have shape (years,); the rest have shape (scenarios, years).
     """
-    gpm_shift, ebit_shift = esg_adjustments
-    years = 5
-    data = []
+    years = np.arange(1, _PROJECTION_YEARS + 1).astype(np.float64)
     
     # Initialize projection variables
-    revenue_projected = inputs['revenue']
-    nwc_last = inputs['revenue'] * inputs['nwc_pct']
-    base_gross_margin = ((inputs['revenue'] - inputs['cogs_inputs'][0]) / inputs['revenue']) * 100
+    nwc_0 = revenue_0 * nwc_pct
     
-    for year in range(1, years + 1):
-        # Project revenue with growth
-        revenue_projected *= (1 + inputs['growth_rate'] / 100)
-        
-        # Apply progressive ESG adjustments (linear progression over 5 years)
-        esg_progress = year / years
-        gpm_adjusted = base_gross_margin + gpm_shift * esg_progress
-        
-        # Calculate adjusted COGS and gross profit
-        cogs_projected = revenue_projected * (1 - gpm_adjusted / 100)
-        gross_profit = revenue_projected - cogs_projected
-        
-        # Calculate operating expenses as percentage of revenue
-        sga_expense = revenue_projected * (inputs['sga'] / 100)
-        rd_expense = revenue_projected * (inputs['rd'] / 100)
-        opex_expense = revenue_projected * (inputs['opex'] / 100)
-        
-        # Calculate base EBIT (before ESG adjustments)
-        ebit_base = gross_profit - sga_expense - rd_expense - opex_expense
-        
-        # Apply EBIT improvement as basis points to revenue (proper financial approach)
-        ebit_adjustment = revenue_projected * (ebit_shift * esg_progress / 100)
-        ebit_projected = ebit_base + ebit_adjustment
-        
-        # Calculate EBIAT (Earnings Before Interest After Tax)
-        ebiat = ebit_projected * (1 - inputs['tax_rate'] / 100)
-        
-        # Calculate cash flow components
-        depreciation_projected = revenue_projected * (inputs['dep_pct'] / 100)
-        capex_projected = revenue_projected * (inputs['capex_pct'] / 100)
-        
-        # Net Working Capital change calculation
-        nwc = revenue_projected * inputs['nwc_pct']
-        delta_nwc = nwc - nwc_last
-        nwc_last = nwc
-        
-        # Free Cash Flow calculation
-        fcf = ebiat + depreciation_projected - capex_projected - delta_nwc
-        
-        # Discounting
-        discount_factor = 1 / ((1 + inputs['wacc'] / 100) ** year)
-        discounted_fcf = fcf * discount_factor
-        
-        # Append year data
-        data.append([
-            f"Year {year}", revenue_projected, cogs_projected, ebit_projected, ebiat,
-            depreciation_projected, capex_projected, delta_nwc, fcf, 
-            discount_factor, discounted_fcf
-        ])
-    
-    # Create DataFrame
-    columns = [
-        "Year", "Revenue", "COGS", "EBIT", "EBIAT", "Depreciation",
-        "CapEx", "Change in NWC", "FCF", "Discount Factor", "Discounted FCF"
-    ]
+    # Project revenue with growth (cumulative growth factors in a single ufunc pass)
+    revenue = revenue_0 * np.cumprod(np.full(len(years), 1 + growth_rate / 100))
+    
+    # Apply progressive ESG adjustments (linear progression over 5 years), one row per scenario
+    esg_progress = years / len(years)
+    gpm_adjusted = base_gross_margin + np.outer(gpm_shifts, esg_progress)
+    
+    # Calculate adjusted COGS and gross profit
+    cogs = revenue * (1 - gpm_adjusted / 100)
+    gross_profit = revenue - cogs
     
-    return pd.DataFrame(data, columns=columns)
+    # Calculate base EBIT (before ESG adjustments), with operating expenses as percentage of revenue
+    ebit_base = gross_profit - revenue * ((sga + rd + opex) / 100)
+    
+    # Apply EBIT improvement as basis points to revenue (proper financial approach)
+    ebit = ebit_base + revenue * (np.outer(ebit_shifts, esg_progress) / 100)
+    
+    # Calculate EBIAT (Earnings Before Interest After Tax)
+    ebiat = ebit * (1 - tax_rate / 100)
+    
+    # Calculate cash flow components
+    depreciation = revenue * (dep_pct / 100)
+    capex = revenue * (capex_pct / 100)
+    
+    # Net Working Capital change calculation
+    nwc = revenue * nwc_pct
+    delta_nwc = np.diff(np.concatenate((np.array([nwc_0]), nwc)))
+    
+    # Free Cash Flow calculation
+    fcf = ebiat + depreciation - capex - delta_nwc
+    
+    # Discounting
+    discount_factor = np.cumprod(np.full(len(years), 1 / (1 + wacc / 100)))
+    discounted_fcf = fcf * discount_factor
+    
+    return (revenue, cogs, ebit, ebiat, depreciation, capex, delta_nwc,
+            fcf, discount_factor, discounted_fcf)
 
-def calculate_valuation(df, inputs):
+def _run_dcf_scenarios(inputs, scenario_adjustments):
     """
-    Calculate enterprise value, equity value, and price per share.
+    Run _dcf_kernel once over several (gpm_shift, ebit_shift) pairs.
     
-    Args:
-        df (pandas.DataFrame): DCF projection DataFrame
-        inputs (dict): Financial input parameters
-        
     Returns:
-        dict: Valuation metrics including TV, EV, equity value, and price per share
+        list: One tuple of per-year arrays per scenario, in the order given
     """
+    shifts = np.asarray(scenario_adjustments, dtype=np.float64).reshape(-1, 2)
+    base_gross_margin = ((inputs.revenue - inputs.cogs_inputs[0]) / inputs.revenue) * 100
+    
+    arrays = _dcf_kernel(
+        float(inputs.revenue), float(inputs.growth_rate), float(inputs.wacc),
+        float(inputs.tax_rate), float(inputs.nwc_pct), float(inputs.dep_pct),
+        float(inputs.capex_pct), float(inputs.sga), float(inputs.rd),
+        float(inputs.opex), float(base_gross_margin),
+        np.ascontiguousarray(shifts[:, 0]), np.ascontiguousarray(shifts[:, 1])
+    )
+    
+    # Shared 1-D lines are reused as-is; 2-D lines are split into per-scenario rows
+    return [
+        tuple(arr[i] if arr.ndim == 2 else arr for arr in arrays)
+        for i in range(len(shifts))
+    ]
+
+def _run_dcf_kernel(inputs, esg_adjustments):
+    """Unpack the inputs and run _dcf_kernel, returning its tuple of per-year arrays"""
+    return _run_dcf_scenarios(inputs, (esg_adjustments,))[0]
+
+def _projection_frame(projection):
+    """Build the projection DataFrame from the arrays returned by _dcf_kernel"""
+    (revenue, cogs, ebit, ebiat, depreciation, capex, delta_nwc,
+     fcf, discount_factor, discounted_fcf) = projection
+    
+    df = pd.DataFrame({
+        "Year": [f"Year {year}" for year in range(1, len(revenue) + 1)],
+        "Revenue": revenue,
+        "COGS": cogs,
+        "EBIT": ebit,
+        "EBIAT": ebiat,
+        "Depreciation": depreciation,
+        "CapEx": capex,
+        "Change in NWC": delta_nwc,
+        "FCF": fcf,
+        "Discount Factor": discount_factor,
+        "Discounted FCF": discounted_fcf
+    })
+    
+    # Every column but the Year labels is float64; record that once so display code
+    # does not have to rescan the dtypes on each rerun
+    df.attrs['numeric_cols'] = [col for col in df.columns if col != "Year"]
+    
+    return df
+
+def _valuation_from_arrays(fcf, discount_factor, discounted_fcf, inputs):
+    """Reduce per-year FCF arrays to the valuation metrics dict"""
+    total_pv_fcf = float(discounted_fcf.sum())
+    
     # Terminal Value calculation (Gordon Growth Model)
-    terminal_fcf = df.iloc[-1]["FCF"]
-    terminal_growth = inputs['growth_rate'] / 100  # Use same growth rate for terminal
-    terminal_value = terminal_fcf * (1 + terminal_growth) / (inputs['wacc'] / 100 - terminal_growth)
+    terminal_fcf = fcf[-1]
+    terminal_growth = inputs.growth_rate / 100  # Use same growth rate for terminal
+    terminal_value = terminal_fcf * (1 + terminal_growth) / (inputs.wacc / 100 - terminal_growth)
     
-    # Present value of terminal value
-    years = len(df)
-    present_value_tv = terminal_value / ((1 + inputs['wacc'] / 100) ** years)
+    # Present value of terminal value, reusing the final-year discount factor
+    present_value_tv = terminal_value * float(discount_factor[-1])
     
     # Enterprise Value = Sum of discounted FCFs + Present value of TV
-    enterprise_value = df["Discounted FCF"].sum() + present_value_tv
+    enterprise_value = total_pv_fcf + present_value_tv
     
     # Equity Value = Enterprise Value - Net Debt
-    equity_value = enterprise_value - inputs['net_debt']
+    equity_value = enterprise_value - inputs.net_debt
     
     # Price per share
-    price_per_share = equity_value / inputs['shares_outstanding']
+    price_per_share = equity_value / inputs.shares_outstanding
     
     return {
         'terminal_value': terminal_value,
@@ -397,79 +618,179 @@ def calculate_valuation(df, inputs):
         'enterprise_value': enterprise_value,
         'equity_value': equity_value,
         'price_per_share': price_per_share,
-        'total_pv_fcf': df["Discounted FCF"].sum()
+        'total_pv_fcf': total_pv_fcf
     }
 
+@st.cache_data(show_spinner=False, max_entries=64)
+def calculate_scenarios(inputs, esg_adjustments):
+    """
+    Project and value the baseline and ESG scenarios in a single kernel pass.
+    
+    Args:
+        inputs (DCFInputs): Financial input parameters
+        esg_adjustments (tuple): ESG-based margin adjustments
+        
+    Returns:
+        tuple: ((baseline_df, baseline_valuation), (esg_df, esg_valuation))
+    """
+    return tuple(
+        (_projection_frame(projection), _valuation_from_arrays(*projection[7:], inputs))
+        for projection in _run_dcf_scenarios(inputs, ((0.0, 0.0), esg_adjustments))
+    )
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def dcf_and_valuation(inputs, esg_adjustments):
+    """
+    Run the DCF projection and valuation in one pass over the kernel arrays.
+    
+    Args:
+        inputs (DCFInputs): Financial input parameters
+        esg_adjustments (tuple): ESG-based margin adjustments
+        
+    Returns:
+        tuple: (projection DataFrame, valuation metrics dict)
+    """
+    projection = _run_dcf_kernel(inputs, esg_adjustments)
+    fcf, discount_factor, discounted_fcf = projection[7:]
+    valuation = _valuation_from_arrays(fcf, discount_factor, discounted_fcf, inputs)
+    
+    return _projection_frame(projection), valuation
+
+@st.cache_resource(show_spinner=False)
+def warm_up_dcf_kernel():
+    """
+    Compile _dcf_kernel (or load it from Numba's on-disk cache) once per server process.
+    
+    The dummy call uses the same argument types as real runs, so the first submitted
+    form reuses this specialization instead of paying the JIT cost. Without Numba it is
+    just a cheap NumPy call.
+    """
+    no_shift = np.zeros(2)
+    _dcf_kernel(10000.0, 5.0, 8.0, 24.0, 0.1, 3.6, 4.0, 6.0, 4.0, 2.0, 50.0, no_shift, no_shift)
+
 # =============================================================================
 # ENHANCED VISUALIZATION FUNCTIONS
 # =============================================================================
 
+# Scatter traces longer than this render through WebGL (Scattergl) instead of SVG
+_WEBGL_POINT_THRESHOLD = 1000
 
+# FCF bar colours, lighter to darker, one per projection year
+_BLUE_GRADIENT = ('#C5E4FD', '#7AC3E8', '#2E86AB', '#1F5F7A', '#0B132B')
 
-def create_margin_impact_analysis(df, esg_adjustments, financial_inputs):
+# Layout of the FCF bar chart; nothing in it depends on the data
+_FCF_LAYOUT = dict(
+    xaxis=dict(
+        title=dict(text="Year", font=dict(size=14, color='white')),
+        tickfont=dict(size=12, color='white'),
+        showgrid=False
+    ),
+    yaxis=dict(
+        title=dict(text="Free Cash Flow ($M)", font=dict(size=14, color='white')),
+        tickfont=dict(size=12, color='white'),
+        showgrid=False
+    ),
+    plot_bgcolor='rgba(0,0,0,0)',
+    paper_bgcolor='rgba(0,0,0,0)',
+    showlegend=False,
+    height=500,
+    margin=dict(t=80, b=60, l=60, r=60)
+)
+
+def _fmt_money(values, decimals=0, suffix=''):
+    """
+    Format numbers as dollar labels for chart text, e.g. ``$1,234M``.
+    
+    Args:
+        values (array-like): Numbers to format
+        decimals (int or array-like): Decimal places, shared or one per value
+        suffix (str): Unit appended to every label
+        
+    Returns:
+        list: Formatted label strings
+    """
+    values = np.asarray(values, dtype=np.float64)
+    decimals = np.broadcast_to(decimals, values.shape)
+    return [f'${val:,.{dp}f}{suffix}' for val, dp in zip(values, decimals)]
+
+def _fmt_pct(values):
+    """Format numbers as one-decimal percentage labels, e.g. ``42.3%``"""
+    return np.char.add(np.char.mod('%.1f', np.asarray(values, dtype=np.float64)), '%').tolist()
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def create_margin_impact_analysis(baseline_df, df):
     """
     Create a multi-line chart comparing ESG vs Non-ESG margin trajectories over time.
     """
-    gmp_shift, ebit_shift = esg_adjustments
-    years = [1, 2, 3, 4, 5]  # Numeric years for better line chart
+    import plotly.graph_objects as go
+    
+    years = np.arange(1, len(df) + 1)  # Numeric years for better line chart
     
     # Calculate non-ESG baseline margins
-    baseline_df = calculate_dcf_projection(financial_inputs, (0, 0))  # No ESG adjustments
-    baseline_gross_margins = [(baseline_df.iloc[i]["Revenue"] - baseline_df.iloc[i]["COGS"]) / baseline_df.iloc[i]["Revenue"] * 100 for i in range(5)]
-    baseline_operating_margins = [baseline_df.iloc[i]["EBIT"] / baseline_df.iloc[i]["Revenue"] * 100 for i in range(5)]
+    baseline_gross_margins = ((baseline_df["Revenue"] - baseline_df["COGS"]) / baseline_df["Revenue"] * 100).to_numpy()
+    baseline_operating_margins = (baseline_df["EBIT"] / baseline_df["Revenue"] * 100).to_numpy()
     
     # Extract ESG-enhanced margins from df
-    esg_gross_margins = [(df.iloc[i]["Revenue"] - df.iloc[i]["COGS"]) / df.iloc[i]["Revenue"] * 100 for i in range(5)]
-    esg_operating_margins = [df.iloc[i]["EBIT"] / df.iloc[i]["Revenue"] * 100 for i in range(5)]
+    esg_gross_margins = ((df["Revenue"] - df["COGS"]) / df["Revenue"] * 100).to_numpy()
+    esg_operating_margins = (df["EBIT"] / df["Revenue"] * 100).to_numpy()
+    esg_gross_labels = _fmt_pct(esg_gross_margins)
+    esg_operating_labels = _fmt_pct(esg_operating_margins)
+    
+    # SVG is sharper and cheaper for short series; WebGL only pays off for long ones
+    scatter = go.Scattergl if len(years) > _WEBGL_POINT_THRESHOLD else go.Scatter
     
     fig = go.Figure()
     
     # Non-ESG Gross Margin line (same color as ESG, consistent styling)
-    fig.add_trace(go.Scatter(
+    fig.add_trace(scatter(
         x=years,
         y=baseline_gross_margins,
         mode='lines+markers',
         name='Gross Margin (Baseline)',
         line=dict(color=COLORS['primary'], width=3, dash='dash'),
         marker=dict(size=8, color=COLORS['primary'], symbol='circle-open'),
-        hovertemplate='<b>Year %{x}</b><br>Baseline Gross Margin: %{y:.1f}%<extra></extra>'
+        hovertemplate='<b>Year %{x}</b><br>Baseline Gross Margin: %{y:.1f}%<extra></extra>',
+        _validate=False
     ))
     
     # ESG Gross Margin line (primary color)
-    fig.add_trace(go.Scatter(
+    fig.add_trace(scatter(
         x=years,
         y=esg_gross_margins,
         mode='lines+markers',
         name='Gross Margin (ESG-Enhanced)',
         line=dict(color=COLORS['primary'], width=4),
         marker=dict(size=10, color=COLORS['primary'], symbol='circle'),
-        text=[f'{val:.1f}%' for val in esg_gross_margins],
+        text=esg_gross_labels,
         textposition='top center',
-        hovertemplate='<b>Year %{x}</b><br>ESG Gross Margin: %{y:.1f}%<extra></extra>'
+        hovertemplate='<b>Year %{x}</b><br>ESG Gross Margin: %{y:.1f}%<extra></extra>',
+        _validate=False
     ))
     
     # Non-ESG Operating Margin line (same color as ESG, consistent styling)
-    fig.add_trace(go.Scatter(
+    fig.add_trace(scatter(
         x=years,
         y=baseline_operating_margins,
         mode='lines+markers',
         name='Operating Margin (Baseline)',
         line=dict(color=COLORS['secondary'], width=3, dash='dash'),
         marker=dict(size=8, color=COLORS['secondary'], symbol='square-open'),
-        hovertemplate='<b>Year %{x}</b><br>Baseline Operating Margin: %{y:.1f}%<extra></extra>'
+        hovertemplate='<b>Year %{x}</b><br>Baseline Operating Margin: %{y:.1f}%<extra></extra>',
+        _validate=False
     ))
     
     # ESG Operating Margin line (secondary color)
-    fig.add_trace(go.Scatter(
+    fig.add_trace(scatter(
         x=years,
         y=esg_operating_margins,
         mode='lines+markers',
         name='Operating Margin (ESG-Enhanced)',
         line=dict(color=COLORS['secondary'], width=4),
         marker=dict(size=10, color=COLORS['secondary'], symbol='square'),
-        text=[f'{val:.1f}%' for val in esg_operating_margins],
+        text=esg_operating_labels,
         textposition='top center',
-        hovertemplate='<b>Year %{x}</b><br>ESG Operating Margin: %{y:.1f}%<extra></extra>'
+        hovertemplate='<b>Year %{x}</b><br>ESG Operating Margin: %{y:.1f}%<extra></extra>',
+        _validate=False
     ))
     
     fig.update_layout(
@@ -508,183 +829,129 @@ def create_margin_impact_analysis(df, esg_adjustments, financial_inputs):
     
     return fig
 
-def create_scenario_comparison(inputs, esg_adjustments):
+@st.cache_data(show_spinner=False, max_entries=64)
+def create_scenario_comparison(baseline_valuation, esg_valuation):
     """
-    Create a 2x2 subplot comparison showing individual valuation metrics with different scales.
+    Create a grouped bar chart comparing baseline and ESG-enhanced valuation metrics.
+    
+    A log-scaled y-axis keeps per-share prices readable next to $M totals; it falls
+    back to a linear axis when any metric is zero or negative.
     """
-    # Calculate baseline scenario (without ESG)
-    baseline_df = calculate_dcf_projection(inputs, (0, 0))  # No ESG adjustments
-    baseline_valuation = calculate_valuation(baseline_df, inputs)
-    
-    # Calculate ESG scenario
-    esg_df = calculate_dcf_projection(inputs, esg_adjustments)
-    esg_valuation = calculate_valuation(esg_df, inputs)
-    
-    # Create 2x2 subplots with better spacing
-    fig = make_subplots(
-        rows=2, cols=2,
-        subplot_titles=(
-            "Enterprise Value ($M)", 
-            "Equity Value ($M)", 
-            "Price per Share ($)", 
-            "Total PV of FCF ($M)"
-        ),
-        vertical_spacing=0.25,
-        horizontal_spacing=0.15
-    )
+    import plotly.graph_objects as go
+    
+    metrics = ['Enterprise Value ($M)', 'Equity Value ($M)', 'Price per Share ($)', 'Total PV of FCF ($M)']
+    metric_keys = ['enterprise_value', 'equity_value', 'price_per_share', 'total_pv_fcf']
+    decimals = [0, 0, 2, 0]  # Price per share is shown in dollars and cents
+    
+    baseline_values = np.array([baseline_valuation[key] for key in metric_keys], dtype=np.float64)
+    esg_values = np.array([esg_valuation[key] for key in metric_keys], dtype=np.float64)
     
-    # Data for each metric
-    metrics_data = [
-        ('Enterprise Value', baseline_valuation['enterprise_value'], esg_valuation['enterprise_value'], 1, 1),
-        ('Equity Value', baseline_valuation['equity_value'], esg_valuation['equity_value'], 1, 2),
-        ('Price per Share', baseline_valuation['price_per_share'], esg_valuation['price_per_share'], 2, 1),
-        ('Total PV of FCF', baseline_valuation['total_pv_fcf'], esg_valuation['total_pv_fcf'], 2, 2)
+    baseline_labels = _fmt_money(baseline_values, decimals)
+    esg_labels = _fmt_money(esg_values, decimals)
+    
+    # Percentage uplift shown alongside each ESG-enhanced bar (avoid division by zero)
+    esg_text = [
+        f'{label} ({(esg_val - base_val) / base_val * 100:+.1f}%)' if base_val != 0 else label
+        for label, base_val, esg_val in zip(esg_labels, baseline_values, esg_values)
     ]
     
-    for i, (metric_name, baseline_val, esg_val, row, col) in enumerate(metrics_data):
-        # Add bars for each scenario with professional colors
-        fig.add_trace(
-            go.Bar(
-                name='Without ESG' if i == 0 else '',
-                x=['Baseline', 'ESG-Enhanced'],
-                y=[baseline_val, esg_val],
-                marker=dict(color=[COLORS['neutral'], COLORS['primary']]),
-                text=[
-                    f'${baseline_val:,.2f}' if 'Price' in metric_name else f'${baseline_val:,.0f}',
-                    f'${esg_val:,.2f}' if 'Price' in metric_name else f'${esg_val:,.0f}'
-                ],
-                textposition='outside',
-                textfont=dict(size=10, color='white'),
-                showlegend=False,  # Remove legend completely
-                hovertemplate=f'<b>{metric_name}</b><br>%{{x}}: %{{y:$,.0f}}<extra></extra>' if 'Price' not in metric_name else f'<b>{metric_name}</b><br>%{{x}}: %{{y:$,.2f}}<extra></extra>'
-            ),
-            row=row, col=col
-        )
-        
-        # Add connecting line to highlight the difference
-        fig.add_trace(
-            go.Scatter(
-                x=['Baseline', 'ESG-Enhanced'],
-                y=[baseline_val, esg_val],
-                mode='lines+markers',
-                line=dict(
-                    color=COLORS['tertiary'],  # Professional accent color
-                    width=3,
-                    dash='dot'
-                ),
-                marker=dict(
-                    color=COLORS['tertiary'],
-                    size=8,
-                    symbol='circle'
-                ),
-                showlegend=False,
-                hoverinfo='skip',  # Don't show hover for the connecting line
-                name=''
-            ),
-            row=row, col=col
-        )
-        
-        # Calculate and add percentage increase annotation
-        if baseline_val != 0:  # Avoid division by zero
-            pct_increase = ((esg_val - baseline_val) / baseline_val) * 100
-            
-            # Position annotation in the middle of the line
-            mid_x = 0.5  # Middle between the two x positions
-            mid_y = (baseline_val + esg_val) / 2
-            
-            fig.add_annotation(
-                x=mid_x,
-                y=mid_y,
-                text=f"+{pct_increase:.1f}%",
-                showarrow=True,
-                arrowhead=2,
-                arrowsize=1,
-                arrowwidth=2,
-                arrowcolor=COLORS['tertiary'],
-                font=dict(
-                    color=COLORS['tertiary'],
-                    size=12,
-                    family='Arial Black'
-                ),
-                bgcolor='rgba(0,0,0,0.7)',
-                bordercolor=COLORS['tertiary'],
-                borderwidth=1,
-                borderpad=4,
-                row=row, col=col
-            )
+    fig = go.Figure()
+    
+    fig.add_trace(go.Bar(
+        name='Baseline',
+        x=metrics,
+        y=baseline_values,
+        marker=dict(color=COLORS['neutral']),
+        text=baseline_labels,
+        customdata=baseline_labels,
+        textposition='outside',
+        textfont=dict(size=10, color='white'),
+        hovertemplate='<b>%{x}</b><br>Baseline: %{customdata}<extra></extra>',
+        _validate=False
+    ))
+    
+    fig.add_trace(go.Bar(
+        name='ESG-Enhanced',
+        x=metrics,
+        y=esg_values,
+        marker=dict(color=COLORS['primary']),
+        text=esg_text,
+        customdata=esg_labels,
+        textposition='outside',
+        textfont=dict(size=10, color=COLORS['tertiary']),
+        hovertemplate='<b>%{x}</b><br>ESG-Enhanced: %{customdata}<extra></extra>',
+        _validate=False
+    ))
+    
+    all_positive = bool((baseline_values > 0).all() and (esg_values > 0).all())
     
-    # Update layout
     fig.update_layout(
-        # title=dict(
-        #     text="ESG Integration Impact: Detailed Valuation Comparison",
-        #     font=dict(size=18, color='white'),
-        #     x=0.5,
-        #     y=0.95
-        # ),
+        barmode='group',
+        xaxis=dict(
+            tickfont=dict(size=12, color='white')
+        ),
+        yaxis=dict(
+            type='log' if all_positive else 'linear',
+            tickfont=dict(size=12, color='white'),
+            showgrid=True,
+            gridcolor='rgba(255,255,255,0.1)'
+        ),
         plot_bgcolor='rgba(0,0,0,0)',
         paper_bgcolor='rgba(0,0,0,0)',
+        legend=dict(
+            font=dict(color='white', size=11),
+            bgcolor='rgba(0,0,0,0.3)',
+            bordercolor='rgba(255,255,255,0.2)',
+            borderwidth=1,
+            orientation='h',
+            x=0.5,
+            xanchor='center',
+            y=1.08
+        ),
         height=600,
-        margin=dict(t=100, b=60, l=60, r=60),
-        showlegend=False  # Completely remove legend
+        margin=dict(t=100, b=60, l=60, r=60)
     )
     
-    # Update all axes with better formatting and more y-axis margin
-    fig.update_xaxes(
-        tickfont=dict(color='white', size=9),
-        title_font=dict(color='white', size=10)
-    )
-    
-    # Add individual y-axis ranges with proper margins for each subplot
-    for i, (metric_name, baseline_val, esg_val, row, col) in enumerate(metrics_data):
-        y_min = min(baseline_val, esg_val)
-        y_max = max(baseline_val, esg_val)
-        y_range = y_max - y_min
-        margin_factor = 0.50  # 30% margin above and below
-        
-        fig.update_yaxes(
-            range=[y_min - (y_range * margin_factor), y_max + (y_range * margin_factor)],
-            showgrid=True,
-            gridcolor='rgba(255,255,255,0.1)',
-            row=row, col=col
-        )
-    
-    # Update subplot titles with better styling
-    for annotation in fig['layout']['annotations']:
-        annotation['font'] = dict(color='white', size=12, family='Arial')
-        annotation['y'] = annotation['y'] + 0.02  # Move titles up slightly
-    
-    return fig, baseline_valuation, esg_valuation
+    return fig
 
-def create_esg_impact_waterfall(baseline_val, esg_val, esg_data):
+@st.cache_data(show_spinner=False, max_entries=64)
+def create_esg_impact_waterfall(baseline_ev, esg_ev, esg_data):
     """
     Create a waterfall chart showing individual ESG contributions to valuation uplift.
+    
+    Only the two enterprise values are needed, so callers pass scalars rather than
+    full valuation results.
     """
-    # Calculate individual ESG impacts based on actual coefficient contributions
-    total_uplift = esg_val['enterprise_value'] - baseline_val['enterprise_value']
+    import plotly.graph_objects as go
     
-    # Calculate actual improvements for each ESG metric
-    ghg_improvement = esg_data['ghg_target'] - esg_data['ghg_0']  # Negative = reduction
-    water_improvement = esg_data['water_target'] - esg_data['water_0']  # Negative = reduction  
-    diversity_improvement = esg_data['diversity_target'] - esg_data['diversity_0']  # Positive = increase
-    waste_improvement = esg_data['swr_target'] - esg_data['swr_0']  # Positive = increase
+    # Calculate individual ESG impacts based on actual coefficient contributions
+    total_uplift = esg_ev - baseline_ev
     
-    # Research coefficients (from your model)
-    ghg_coef = -6.15      # %GPM per MtCO2e reduction
-    water_coef = -3.09    # %GPM per m³ reduction  
-    diversity_coef = 1.43 # %EBIT per % female employee increase
-    waste_coef = -0.11    # %EBIT per % sustainable waste ratio increase
+    # Actual improvements for each ESG metric (GHG/water: negative = reduction; diversity/SWR: positive = increase)
+    improvements = _esg_deltas(esg_data)
     
     # Calculate approximate individual contributions
     # These are proportional estimates based on coefficient magnitudes
-    total_coef_impact = abs(ghg_coef * ghg_improvement) + abs(water_coef * water_improvement) + abs(diversity_coef * diversity_improvement) + abs(waste_coef * waste_improvement)
-    
-    ghg_impact = total_uplift * (abs(ghg_coef * ghg_improvement) / total_coef_impact) if total_coef_impact > 0 else 0
-    water_impact = total_uplift * (abs(water_coef * water_improvement) / total_coef_impact) if total_coef_impact > 0 else 0
-    diversity_impact = total_uplift * (abs(diversity_coef * diversity_improvement) / total_coef_impact) if total_coef_impact > 0 else 0
-    waste_impact = total_uplift * (abs(waste_coef * waste_improvement) / total_coef_impact) if total_coef_impact > 0 else 0
+    contributions = np.abs(_ESG_COEFS * improvements)
+    total_coef_impact = contributions.sum()
+    impacts = total_uplift * contributions / total_coef_impact if total_coef_impact > 0 else np.zeros(len(contributions))
     
     categories = ['Baseline EV', 'GHG Reduction', 'Water Efficiency', 'Diversity', 'Waste Management', 'ESG-Enhanced EV']
-    values = [baseline_val['enterprise_value'], ghg_impact, water_impact, diversity_impact, waste_impact, 0]
+    waterfall_values = np.concatenate(([baseline_ev], impacts, [esg_ev]))
+    waterfall_text = _fmt_money(waterfall_values, suffix='M')
+    
+    ghg_impact, water_impact, diversity_impact, waste_impact = impacts.tolist()
+    ghg_improvement, water_improvement, diversity_improvement, waste_improvement = improvements.tolist()
+    breakdown = {
+        'ghg_impact': ghg_impact,
+        'water_impact': water_impact, 
+        'diversity_impact': diversity_impact,
+        'waste_impact': waste_impact,
+        'ghg_improvement': ghg_improvement,
+        'water_improvement': water_improvement,
+        'diversity_improvement': diversity_improvement,
+        'waste_improvement': waste_improvement
+    }
     
     fig = go.Figure(go.Waterfall(
         name="ESG Value Creation",
@@ -692,12 +959,13 @@ def create_esg_impact_waterfall(baseline_val, esg_val, esg_data):
         measure=["absolute", "relative", "relative", "relative", "relative", "total"],
         x=categories,
         textposition="outside",
-        text=[f"${val:,.0f}M" for val in [baseline_val['enterprise_value']] + [ghg_impact, water_impact, diversity_impact, waste_impact] + [esg_val['enterprise_value']]],
-        y=[baseline_val['enterprise_value'], ghg_impact, water_impact, diversity_impact, waste_impact, esg_val['enterprise_value']],
+        text=waterfall_text,
+        y=waterfall_values,
         connector={"line":{"color":"rgba(255,255,255,0.3)"}},
         increasing={"marker":{"color":COLORS['success']}},
         decreasing={"marker":{"color":COLORS['danger']}},
-        totals={"marker":{"color":COLORS['primary']}}
+        totals={"marker":{"color":COLORS['primary']}},
+        _validate=False
     ))
     
     fig.update_layout(
@@ -721,51 +989,62 @@ def create_esg_impact_waterfall(baseline_val, esg_val, esg_data):
         height=500
     )
     
-    return fig, {
-        'ghg_impact': ghg_impact,
-        'water_impact': water_impact, 
-        'diversity_impact': diversity_impact,
-        'waste_impact': waste_impact,
-        'ghg_improvement': ghg_improvement,
-        'water_improvement': water_improvement,
-        'diversity_improvement': diversity_improvement,
-        'waste_improvement': waste_improvement
-    }
+    return fig, breakdown
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def create_fcf_projection_chart(years, fcf):
+    """
+    Create a bar chart of the projected free cash flow by year.
+    
+    Args:
+        years (tuple): Year labels
+        fcf (numpy.ndarray): Free cash flow per year ($M), float64
+    """
+    import plotly.graph_objects as go
+    
+    # Add bar chart with consistent color gradient (lighter to darker)
+    bar = go.Bar(
+        x=years,
+        y=fcf,
+        name="Free Cash Flow",
+        marker=dict(
+            color=_BLUE_GRADIENT[:len(fcf)]
+        ),
+        text=_fmt_money(fcf, suffix='M'),
+        textposition='outside',
+        textfont=dict(size=12, color='white'),
+        hovertemplate='<b>%{x}</b><br>' +
+                      'Free Cash Flow: $%{y:,.0f}M<br>' +
+                      '<extra></extra>'
+    )
+    
+    # Pass the static layout straight to the constructor: this skips the separate add_trace and
+    # update_layout passes, and _validate=False skips re-checking the trusted constant. The
+    # figure copies the dict, so _FCF_LAYOUT itself is never mutated.
+    return go.Figure(data=[bar], layout=_FCF_LAYOUT, _validate=False)
 
 # =============================================================================
 # OUTPUT DISPLAY FUNCTIONS
 # =============================================================================
 
-def display_dcf_results(df, valuation_metrics, esg_data, financial_inputs, esg_adjustments):
+def display_dcf_results(df, valuation_metrics, baseline_df, baseline_valuation, esg_data, esg_adjustments):
     """
     Display the DCF results including tables, metrics, and enhanced visualizations.
     
     Args:
-        df (pandas.DataFrame): DCF projection DataFrame
-        valuation_metrics (dict): Calculated valuation metrics
-        esg_data (dict): ESG metrics data
-        financial_inputs (dict): Financial input parameters
+        df (pandas.DataFrame): ESG-adjusted DCF projection DataFrame
+        valuation_metrics (dict): Valuation metrics for the ESG-adjusted projection
+        baseline_df (pandas.DataFrame): DCF projection without ESG adjustments
+        baseline_valuation (dict): Valuation metrics for the baseline projection
+        esg_data (ESGData): ESG metrics data
         esg_adjustments (tuple): ESG-based margin adjustments
     """
     # =============================================================================
     # ESG IMPACT DASHBOARD
     # =============================================================================
     
-    st.markdown(f"""
-    <div style="background: linear-gradient(135deg, rgba(46, 134, 171, 0.15) 0%, rgba(162, 59, 114, 0.1) 100%); 
-                border-radius: 15px; padding: 2rem; margin: 2rem 0; 
-                border: 1px solid rgba(46, 134, 171, 0.3);">
-        <h2 style="color: {COLORS['primary']}; text-align: center; margin-bottom: 1rem; font-size: 2rem;">
-            🌱 ESG IMPACT DASHBOARD
-        </h2>
-        <p style="color: white; text-align: center; font-size: 1.1rem; opacity: 0.9;">
-            Visualizing the financial impact of sustainability initiatives
-        </p>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    # ESG-driven Margin Analysis
-    st.subheader("📊 ESG-Driven Margin Improvements")
+    # Dashboard banner plus the "ESG-Driven Margin Improvements" subheading
+    st.markdown(_ESG_DASHBOARD_HEADER_HTML, unsafe_allow_html=True)
     
     # Add calculation explanation
     gmp_shift, ebit_shift = esg_adjustments
@@ -782,7 +1061,7 @@ def display_dcf_results(df, valuation_metrics, esg_data, financial_inputs, esg_a
     • **Progressive Implementation:** ESG benefits are realized gradually over the 5-year period
     """)
     
-    margin_impact_fig = create_margin_impact_analysis(df, esg_adjustments, financial_inputs)
+    margin_impact_fig = create_margin_impact_analysis(baseline_df, df)
     st.plotly_chart(margin_impact_fig, use_container_width=True)
     
     # Scenario Comparison
@@ -795,39 +1074,28 @@ def display_dcf_results(df, valuation_metrics, esg_data, financial_inputs, esg_a
     The difference shows the financial value created purely through sustainable business practices.
     """)
     
-    scenario_fig, baseline_val, esg_val = create_scenario_comparison(financial_inputs, esg_adjustments)
+    scenario_fig = create_scenario_comparison(baseline_valuation, valuation_metrics)
     st.plotly_chart(scenario_fig, use_container_width=True)
     
     # ESG Value Creation Summary
-    total_value_uplift = esg_val['enterprise_value'] - baseline_val['enterprise_value']
-    uplift_percentage = (total_value_uplift / baseline_val['enterprise_value']) * 100
+    total_value_uplift = valuation_metrics['enterprise_value'] - baseline_valuation['enterprise_value']
+    uplift_percentage = (total_value_uplift / baseline_valuation['enterprise_value']) * 100
     
     # Compact metrics display using columns
     col1, col2, col3 = st.columns([1, 2, 1])
     
     with col2:
-        st.markdown(f"""
-        <div style="background: linear-gradient(135deg, rgba(46, 134, 171, 0.1) 0%, rgba(162, 59, 114, 0.08) 100%); 
-                    border-radius: 8px; padding: 0.8rem; margin: 0.5rem 0; 
-                    border: 1px solid rgba(46, 134, 171, 0.2); text-align: center;">
-            <h4 style="color: {COLORS['primary']}; margin: 0 0 0.5rem 0; font-size: 1.1rem;">💡 ESG Value Creation Impact</h4>
-            <div style="display: flex; justify-content: space-around;">
-                <div>
-                    <span style="color: white; font-size: 0.9rem;">Total Uplift:</span>
-                    <h3 style="color: {COLORS['success']}; margin: 0.2rem 0; font-size: 1.4rem;">${total_value_uplift:,.0f}M</h3>
-                </div>
-                <div>
-                    <span style="color: white; font-size: 0.9rem;">Increase:</span>
-                    <h3 style="color: {COLORS['success']}; margin: 0.2rem 0; font-size: 1.4rem;">{uplift_percentage:.1f}%</h3>
-                </div>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(
+            _VALUE_CREATION_CARD_TEMPLATE.format(uplift=total_value_uplift, pct=uplift_percentage),
+            unsafe_allow_html=True,
+        )
     
     # Waterfall Chart
     st.subheader("🌊 ESG Value Creation Breakdown")
     
-    waterfall_fig, breakdown_data = create_esg_impact_waterfall(baseline_val, esg_val, esg_data)
+    waterfall_fig, breakdown_data = create_esg_impact_waterfall(
+        baseline_valuation['enterprise_value'], valuation_metrics['enterprise_value'], esg_data
+    )
     
     # Add detailed calculation explanation
     with st.expander("🔬 **Calculation Methodology** - Click to expand"):
@@ -864,36 +1132,27 @@ def display_dcf_results(df, valuation_metrics, esg_data, financial_inputs, esg_a
     # TRADITIONAL DCF RESULTS
     # =============================================================================
     
-    st.markdown(f"""
-    <div style="background: linear-gradient(135deg, rgba(255, 255, 255, 0.05) 0%, rgba(255, 255, 255, 0.02) 100%); 
-                border-radius: 15px; padding: 2rem; margin: 2rem 0; 
-                border: 1px solid rgba(255, 255, 255, 0.1);">
-        <h2 style="color: {COLORS['text_light']}; text-align: center; margin-bottom: 1rem; font-size: 2rem;">
-            📊 Detailed Financial Analysis
-        </h2>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    # Format DataFrame for display
-    df_display = df.copy()
+    # Section banner plus the "Projected Free Cash Flows" subheading
+    st.markdown(_FINANCIAL_ANALYSIS_HEADER_HTML, unsafe_allow_html=True)
     
-    # Main DCF Table
-    st.subheader("📊 Projected Free Cash Flows")
+    # Main DCF Table (Styler formatting does not mutate df, so no display copy is needed)
+    numeric_cols = df.attrs['numeric_cols']
     st.dataframe(
-        df_display.style.format({
-            col: "{:,.2f}" for col in df_display.select_dtypes(include=[np.number]).columns
-        })
+        df.style.format({col: "{:,.2f}" for col in numeric_cols})
     )
     
     # Financial Metrics Table
     st.subheader("📋 Key Financial Metrics (by Year)")
-    df_metrics = df.copy()
-    df_metrics["Gross Profit"] = df_metrics["Revenue"] - df_metrics["COGS"]
-    df_metrics["Gross Margin (%)"] = (df_metrics["Gross Profit"] / df_metrics["Revenue"]) * 100
-    df_metrics["Operating Margin (%)"] = (df_metrics["EBIT"] / df_metrics["Revenue"]) * 100
+    revenue = df["Revenue"].to_numpy()
+    gross_profit = revenue - df["COGS"].to_numpy()
+    df_metrics = pd.DataFrame({
+        "Year": df["Year"].to_numpy(),
+        "Gross Margin (%)": gross_profit / revenue * 100,
+        "Operating Margin (%)": df["EBIT"].to_numpy() / revenue * 100
+    })
     
     st.dataframe(
-        df_metrics[["Year", "Gross Margin (%)", "Operating Margin (%)"]].style.format({
+        df_metrics.style.format({
             "Gross Margin (%)": "{:.2f}",
             "Operating Margin (%)": "{:.2f}"
         })
@@ -903,62 +1162,30 @@ def display_dcf_results(df, valuation_metrics, esg_data, financial_inputs, esg_a
     st.subheader("💰 Final Valuation Summary")
     col1, col2 = st.columns(2)
     
+    # One markdown element per column; blank lines keep each figure on its own paragraph
     with col1:
-        st.markdown(f"**Terminal Value (TV):** ${valuation_metrics['terminal_value']:,.2f}M")
-        st.markdown(f"**Present Value of TV:** ${valuation_metrics['present_value_tv']:,.2f}M")
-        st.markdown(f"**Enterprise Value (EV):** ${valuation_metrics['enterprise_value']:,.2f}M")
+        st.markdown(
+            f"**Terminal Value (TV):** ${valuation_metrics['terminal_value']:,.2f}M\n\n"
+            f"**Present Value of TV:** ${valuation_metrics['present_value_tv']:,.2f}M\n\n"
+            f"**Enterprise Value (EV):** ${valuation_metrics['enterprise_value']:,.2f}M"
+        )
     
     with col2:
-        st.markdown(f"**Equity Value:** ${valuation_metrics['equity_value']:,.2f}M")
-        st.markdown(f"**Price per Share:** ${valuation_metrics['price_per_share']:,.2f}")
-        st.markdown(f"**Total PV of FCF:** ${valuation_metrics['total_pv_fcf']:,.2f}M")
+        st.markdown(
+            f"**Equity Value:** ${valuation_metrics['equity_value']:,.2f}M\n\n"
+            f"**Price per Share:** ${valuation_metrics['price_per_share']:,.2f}\n\n"
+            f"**Total PV of FCF:** ${valuation_metrics['total_pv_fcf']:,.2f}M"
+        )
     
     # Free Cash Flow Visualization
     st.subheader("📊 Free Cash Flow Projection")
     
-    # Create interactive Plotly chart
-    fig = go.Figure()
-    
-    # Add bar chart with consistent color gradient (lighter to darker)
-    # Create blue gradient from lighter to darker
-    blue_gradient = ['#C5E4FD', '#7AC3E8', '#2E86AB', '#1F5F7A', '#0B132B']
-    
-    fig.add_trace(go.Bar(
-        x=df["Year"],
-        y=df["FCF"],
-        name="Free Cash Flow",
-        marker=dict(
-            color=blue_gradient[:len(df)]
-        ),
-        text=[f'${value:,.0f}M' for value in df["FCF"]],
-        textposition='outside',
-        textfont=dict(size=12, color='white'),
-        hovertemplate='<b>%{x}</b><br>' +
-                      'Free Cash Flow: $%{y:,.0f}M<br>' +
-                      '<extra></extra>'
-    ))
-    
-    # Update layout for beautiful styling
-    fig.update_layout(
-        xaxis=dict(
-            title=dict(text="Year", font=dict(size=14, color='white')),
-            tickfont=dict(size=12, color='white'),
-            showgrid=False
-        ),
-        yaxis=dict(
-            title=dict(text="Free Cash Flow ($M)", font=dict(size=14, color='white')),
-            tickfont=dict(size=12, color='white'),
-            showgrid=False
-        ),
-        plot_bgcolor='rgba(0,0,0,0)',
-        paper_bgcolor='rgba(0,0,0,0)',
-        showlegend=False,
-        height=500,
-        margin=dict(t=80, b=60, l=60, r=60)
-    )
+    # FCF goes in as a float64 array (hashed by value and sent to Plotly as a typed array);
+    # the Year labels stay a tuple because object arrays do not hash by content
+    fcf_fig = create_fcf_projection_chart(tuple(df["Year"]), df["FCF"].to_numpy())
     
     # Display the interactive chart
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(fcf_fig, use_container_width=True)
 
 # =============================================================================
 # NAVIGATION FUNCTION
@@ -1052,91 +1279,9 @@ if st.session_state.current_page == 'landing':
     """, unsafe_allow_html=True)
     
     # Feature cards using columns
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        st.markdown("""
-        <div style="
-            background: rgba(255, 255, 255, 0.1);
-            backdrop-filter: blur(10px);
-            border: 1px solid rgba(255, 255, 255, 0.2);
-            border-radius: 16px;
-            padding: 1.2rem 1rem;
-            text-align: center;
-            margin: 1rem 0;
-        ">
-            <h3 style="
-                font-size: 1.1rem;
-                font-weight: 600;
-                color: #ffffff;
-                margin-bottom: 0.6rem;
-                text-shadow: 0 1px 4px rgba(0,0,0,0.5);
-            ">ESG Integration</h3>
-            <p style="
-                font-size: 0.85rem;
-                color: #ffffff;
-                opacity: 0.9;
-                line-height: 1.4;
-                text-shadow: 0 1px 3px rgba(0,0,0,0.4);
-            ">Seamlessly incorporate Environmental, Social, and Governance metrics into traditional financial models</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        st.markdown("""
-        <div style="
-            background: rgba(255, 255, 255, 0.1);
-            backdrop-filter: blur(10px);
-            border: 1px solid rgba(255, 255, 255, 0.2);
-            border-radius: 16px;
-            padding: 1.2rem 1rem;
-            text-align: center;
-            margin: 1rem 0;
-        ">
-            <h3 style="
-                font-size: 1.1rem;
-                font-weight: 600;
-                color: #ffffff;
-                margin-bottom: 0.6rem;
-                text-shadow: 0 1px 4px rgba(0,0,0,0.5);
-            ">Advanced Analytics</h3>
-            <p style="
-                font-size: 0.85rem;
-                color: #ffffff;
-                opacity: 0.9;
-                line-height: 1.4;
-                text-shadow: 0 1px 3px rgba(0,0,0,0.4);
-            ">Research-backed coefficients and sophisticated algorithms for accurate ESG-adjusted valuations</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col3:
-        st.markdown("""
-        <div style="
-            background: rgba(255, 255, 255, 0.1);
-            backdrop-filter: blur(10px);
-            border: 1px solid rgba(255, 255, 255, 0.2);
-            border-radius: 16px;
-            padding: 1.2rem 1rem;
-            text-align: center;
-            margin: 1rem 0;
-        ">
-            <h3 style="
-                font-size: 1.1rem;
-                font-weight: 600;
-                color: #ffffff;
-                margin-bottom: 0.6rem;
-                text-shadow: 0 1px 4px rgba(0,0,0,0.5);
-            ">Real-Time Results</h3>
-            <p style="
-                font-size: 0.85rem;
-                color: #ffffff;
-                opacity: 0.9;
-                line-height: 1.4;
-                text-shadow: 0 1px 3px rgba(0,0,0,0.4);
-            ">Interactive dashboards with instant calculations and beautiful visualizations of your projections</p>
-        </div>
-        """, unsafe_allow_html=True)
+    for col, (title, body) in zip(st.columns(3), _FEATURE_CARDS):
+        with col:
+            st.markdown(_FEATURE_CARD_TEMPLATE.format(title=title, body=body), unsafe_allow_html=True)
     
     # CTA Section
     st.markdown('<div style="margin-top: 2rem;"></div>', unsafe_allow_html=True)
@@ -1145,37 +1290,16 @@ if st.session_state.current_page == 'landing':
     col1, col2, col3 = st.columns([1, 1, 1])
     with col2:
         # Style the button
-        st.markdown("""
-        <style>
-        div[data-testid="column"] > div > div > div > div > div > button {
-            background: linear-gradient(135deg, #2E86AB 0%, #0B132B 100%) !important;
-            color: white !important;
-            font-size: 1.2rem !important;
-            font-weight: 700 !important;
-            padding: 1rem 2.5rem !important;
-            border: none !important;
-            border-radius: 8px !important;
-            box-shadow: 0 8px 25px rgba(46, 134, 171, 0.4), 0 4px 12px rgba(0, 0, 0, 0.3) !important;
-            transition: all 0.4s ease !important;
-            text-transform: uppercase !important;
-            letter-spacing: 1px !important;
-            width: 100% !important;
-            min-width: 250px !important;
-        }
-        
-        div[data-testid="column"] > div > div > div > div > div > button:hover {
-            transform: translateY(-3px) scale(1.05) !important;
-            box-shadow: 0 12px 35px rgba(46, 134, 171, 0.6), 0 6px 20px rgba(0, 0, 0, 0.4) !important;
-            background: linear-gradient(135deg, #3B9BC8 0%, #1A1F3A 100%) !important;
-        }
-        </style>
-        """, unsafe_allow_html=True)
+        st.markdown(_CTA_BUTTON_CSS, unsafe_allow_html=True)
         
         if st.button("🚀 Begin Analysis", key="start_analysis_btn"):
             navigate_to('esg_inputs')
     
     
     st.markdown("</div>", unsafe_allow_html=True)
+    
+    # Compile the DCF kernel while the landing page is already on screen
+    warm_up_dcf_kernel()
 
 # ESG Inputs and Analysis Page
 elif st.session_state.current_page == 'esg_inputs':
@@ -1198,11 +1322,18 @@ elif st.session_state.current_page == 'esg_inputs':
         # Expense Inputs
         st.markdown('<h2 class="esg-col-title">Expense Inputs</h2>', unsafe_allow_html=True)
         st.markdown("<b>COGS per Year ($M)</b>", unsafe_allow_html=True)
-        cogs_cols = st.columns(5)
-        cogs_inputs = [
-            cogs_cols[i].number_input(f"Year {i+1}", value=5000.0 + i * 100.0, min_value=0.0, key=f"cogs_{i}") 
-            for i in range(5)
-        ]
+        cogs_table = st.data_editor(
+            _COGS_DEFAULTS,
+            key="cogs_editor",
+            hide_index=True,
+            num_rows="fixed",
+            use_container_width=True,
+            column_config={
+                col: st.column_config.NumberColumn(col, min_value=0.0, required=True)
+                for col in _COGS_DEFAULTS.columns
+            },
+        )
+        cogs_inputs = cogs_table.iloc[0].to_numpy(dtype=np.float64)
         
         exp_col1, exp_col2, exp_col3 = st.columns(3)
         with exp_col1:
@@ -1280,44 +1411,73 @@ elif st.session_state.current_page == 'esg_inputs':
         submitted = st.form_submit_button("🚀 Run Model")
 
     # Store data in session state
-    st.session_state.esg_data = {
-        'ghg_0': ghg_0, 'water_0': water_0, 'diversity_0': diversity_0, 'swr_0': swr_0,
-        'ghg_target': ghg_target, 'water_target': water_target,
-        'diversity_target': diversity_target, 'swr_target': swr_target
-    }
+    st.session_state.esg_data = ESGData(
+        ghg_0=ghg_0, water_0=water_0, diversity_0=diversity_0, swr_0=swr_0,
+        ghg_target=ghg_target, water_target=water_target,
+        diversity_target=diversity_target, swr_target=swr_target
+    )
 
     # Process results when form is submitted
     if submitted:
         st.session_state.show_dcf = True
 
-    if st.session_state.show_dcf:
+    # The Gordon Growth terminal value is only defined when WACC exceeds the terminal growth rate,
+    # which is the same as the annual revenue growth rate
+    if st.session_state.show_dcf and wacc <= growth_rate:
+        st.error(
+            f"WACC ({wacc:.2f}%) must be greater than the annual revenue growth rate ({growth_rate}%), "
+            "which is also used as the terminal growth rate. Adjust the inputs and run the model again."
+        )
+    elif st.session_state.show_dcf:
         # Prepare input parameters
-        financial_inputs = {
-            'revenue': revenue,
-            'cogs_inputs': cogs_inputs,
-            'sga': sga,
-            'rd': rd,
-            'opex': opex,
-            'dep_pct': dep_pct,
-            'capex_pct': capex_pct,
-            'nwc_pct': nwc_pct,
-            'growth_rate': growth_rate,
-            'wacc': wacc,
-            'tax_rate': tax_rate,
-            'net_debt': net_debt,
-            'shares_outstanding': shares_outstanding
-        }
+        financial_inputs = DCFInputs(
+            revenue=revenue,
+            cogs_inputs=tuple(cogs_inputs.tolist()),
+            sga=sga,
+            rd=rd,
+            opex=opex,
+            dep_pct=dep_pct,
+            capex_pct=capex_pct,
+            nwc_pct=nwc_pct,
+            growth_rate=growth_rate,
+            wacc=wacc,
+            tax_rate=tax_rate,
+            net_debt=net_debt,
+            shares_outstanding=shares_outstanding
+        )
         
-        # Calculate ESG adjustments
-        esg_adjustments = calculate_esg_adjustments(st.session_state.esg_data)
+        # Calculate ESG adjustments, reusing the previous rerun's result if the ESG metrics are unchanged
+        esg_key = st.session_state.esg_data
+        if st.session_state.get('_esg_adj_key') != esg_key:
+            st.session_state['_esg_adj_val'] = calculate_esg_adjustments(st.session_state.esg_data)
+            st.session_state['_esg_adj_key'] = esg_key
+        esg_adjustments = st.session_state['_esg_adj_val']
         
-        # Generate DCF projection
-        dcf_df = calculate_dcf_projection(financial_inputs, esg_adjustments)
+        # Reuse the previous rerun's scenarios when their inputs did not change. The baseline
+        # depends only on the financial inputs, so ESG-only edits keep it as well.
+        # Keys are the input values themselves, not their hash(): equal hashes do not imply
+        # equal inputs (e.g. hash(-1.0) == hash(-2.0) in CPython)
+        baseline_key = financial_inputs
+        dcf_key = (financial_inputs, esg_adjustments)
+        if st.session_state.get('_baseline_key') != baseline_key:
+            # New financial inputs invalidate both scenarios; project them together
+            st.session_state['_baseline_bundle'], st.session_state['_dcf_bundle'] = calculate_scenarios(
+                financial_inputs, esg_adjustments
+            )
+            st.session_state['_baseline_key'] = baseline_key
+            st.session_state['_dcf_key'] = dcf_key
+        elif st.session_state.get('_dcf_key') != dcf_key:
+            # Generate the ESG projection and its valuation in one pass
+            st.session_state['_dcf_bundle'] = dcf_and_valuation(financial_inputs, esg_adjustments)
+            st.session_state['_dcf_key'] = dcf_key
         
-        # Calculate valuation metrics
-        valuation_results = calculate_valuation(dcf_df, financial_inputs)
+        dcf_df, valuation_results = st.session_state['_dcf_bundle']
+        baseline_df, baseline_valuation = st.session_state['_baseline_bundle']
         
         # Display results
-        display_dcf_results(dcf_df, valuation_results, st.session_state.esg_data, financial_inputs, esg_adjustments)
+        display_dcf_results(
+            dcf_df, valuation_results, baseline_df, baseline_valuation,
+            st.session_state.esg_data, esg_adjustments
+        )
 
 